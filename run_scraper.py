@@ -1,32 +1,89 @@
+import argparse
+from contextlib import nullcontext
 from pathlib import Path
 
 from src.scraper.utils.constants import DATA_FILE, LOG_FILE, QA_REPORT_FILE, BASE_SITE_URL, QUOTES_USERNAME, \
-    QUOTES_PASSWORD
-from src.scraper.scraper_runner import run_scraper
+    QUOTES_PASSWORD, OUTPUT_FOLDER, ARCHIVE_FOLDER
+from src.data.storage import COMPRESSIONS, OUTPUT_FORMATS, resolve_data_file
+from src.scraper.scraper_runner import run_scraper, run_offline_reparse
+from src.scraper.utils.profiling import RunProfiler, profile_stage
 from src.scraper.utils.setup_utils import setup_logger, clear_last_execution_data
 from tests.qa import run_qa
 
 BASE_DIR = Path(__file__).resolve().parent
 
 
+def positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Scrape quotes.toscrape.com and run QA over the results.")
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Re-parse the raw HTML archive of the last crawl instead of scraping the live site."
+    )
+    parser.add_argument(
+        "--workers",
+        type=positive_int,
+        default=None,
+        help="Number of processes used by --offline (defaults to all cores)."
+    )
+    parser.add_argument(
+        "--format",
+        choices=OUTPUT_FORMATS,
+        default="json",
+        help="Output data format: a JSON array grouped by page, or one page per line (JSON Lines)."
+    )
+    parser.add_argument(
+        "--compression",
+        choices=COMPRESSIONS,
+        default="none",
+        help="Compression applied to the output data file."
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Profile the run (cProfile, tracemalloc and stack sampling) and write reports to the outputs folder."
+    )
+    return parser.parse_args()
+
+
 def main():
     """
     Entry point to run the quote scraper with predefined credentials and URL.
     """
-    clear_last_execution_data()
+    args = parse_args()
+    if args.offline:
+        clear_last_execution_data(exclude=[ARCHIVE_FOLDER.name])
+    else:
+        clear_last_execution_data()
     setup_logger(str(BASE_DIR / LOG_FILE))
 
     site_url: str = BASE_SITE_URL
     username: str = QUOTES_USERNAME
     password: str = QUOTES_PASSWORD
-    output_json_path: str = DATA_FILE
+    output_json_path: str = str(resolve_data_file(DATA_FILE, args.format, args.compression))
 
     try:
-        print(f"Scraping to {BASE_SITE_URL} started")
-        run_scraper(site_url, username, password, output_json_path)
-        print(f"Scraping completed. Data saved to '{output_json_path}'.")
-        run_qa()
-        print(f"QA report generated at {QA_REPORT_FILE}")
+        with RunProfiler(OUTPUT_FOLDER) if args.profile else nullcontext():
+            if args.offline:
+                print("Offline re-parse of the raw HTML archive started")
+                run_offline_reparse(site_url, output_json_path, args.workers)
+                print(f"Re-parse completed. Data saved to '{output_json_path}'.")
+            else:
+                print(f"Scraping to {BASE_SITE_URL} started")
+                run_scraper(site_url, username, password, output_json_path)
+                print(f"Scraping completed. Data saved to '{output_json_path}'.")
+            with profile_stage("qa"):
+                run_qa(output_json_path)
+            print(f"QA report generated at {QA_REPORT_FILE}")
+        if args.profile:
+            print(f"Profiling reports saved to '{OUTPUT_FOLDER}'.")
     except Exception as e:
         print(f"An error occurred while scraping: {e}")
 
@@ -0,0 +1,186 @@
+import gzip
+import json
+import mmap
+import os
+from codecs import getincrementaldecoder
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterator, Union
+
+PathLike = Union[str, Path]
+
+COMPRESSIONS = ("none", "gzip")
+OUTPUT_FORMATS = ("json", "jsonl")
+
+READ_CHUNK_SIZE = 64 * 1024
+JSON_INDENT = 4
+JSON_ARRAY_CLOSE = b"\n]\n"
+
+
+def resolve_data_file(base_file: PathLike, output_format: str = "json", compression: str = "none") -> Path:
+    """
+    Returns the data file path for the requested format and compression, e.g. data.jsonl.gz.
+    """
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"Unsupported output format: {output_format}")
+    if compression not in COMPRESSIONS:
+        raise ValueError(f"Unsupported compression: {compression}")
+
+    path = Path(base_file).with_suffix(f".{output_format}")
+    if compression == "gzip":
+        path = path.with_name(path.name + ".gz")
+    return path
+
+
+def is_gzip_file(path: PathLike) -> bool:
+    return str(path).endswith(".gz")
+
+
+def is_jsonl_file(path: PathLike) -> bool:
+    return str(path).endswith((".jsonl", ".jsonl.gz"))
+
+
+def _encode_block(data: bytes, compressed: bool) -> bytes:
+    """
+    Encodes a block as written to disk. Compressed blocks are independent gzip members
+    with a fixed mtime, so the same input always produces the same bytes.
+    """
+    return gzip.compress(data, mtime=0) if compressed else data
+
+
+def append_record(path: PathLike, record: Dict[str, Any]) -> None:
+    """
+    Streams a single record to the end of a data file without reading back what is already there.
+
+    JSON Lines files get one line per record. JSON files are kept as a valid, indented array:
+    the closing bracket block is truncated, the record is appended and the bracket is re-written.
+    Files that do not end with that exact block (e.g. written by other tools) are rejected with a
+    ValueError instead of being truncated.
+    For gzip files every block is a separate gzip member, which readers see as one stream.
+    """
+    path = Path(path)
+    compressed = is_gzip_file(path)
+
+    if is_jsonl_file(path):
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        with path.open("ab") as f:
+            f.write(_encode_block(line.encode("utf-8"), compressed))
+        return
+
+    body = json.dumps(record, ensure_ascii=False, indent=JSON_INDENT)
+    body = "\n".join(" " * JSON_INDENT + line for line in body.splitlines())
+    close_block = _encode_block(JSON_ARRAY_CLOSE, compressed)
+
+    if path.exists() and os.path.getsize(path) > 0:
+        with path.open("r+b") as f:
+            f.seek(-min(len(close_block), os.path.getsize(path)), os.SEEK_END)
+            if f.read() != close_block:
+                raise ValueError(f"Cannot append to {path}: it does not end with the expected closing block")
+            f.seek(-len(close_block), os.SEEK_END)
+            f.truncate()
+            f.write(_encode_block(("," + "\n" + body).encode("utf-8"), compressed))
+            f.write(close_block)
+    else:
+        with path.open("wb") as f:
+            f.write(_encode_block(("[\n" + body).encode("utf-8"), compressed))
+            f.write(close_block)
+
+
+def _iter_json_array(stream: BinaryIO) -> Iterator[Dict[str, Any]]:
+    """
+    Incrementally decodes the items of a top-level JSON array read from a binary stream.
+    Only the item currently being decoded is held in memory.
+
+    Raises:
+        ValueError: If the stream is not a single well-formed JSON array.
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = getincrementaldecoder("utf-8")()
+    buffer = ""
+    pos = 0
+    eof = False
+
+    def read_more() -> None:
+        nonlocal buffer, pos, eof
+        chunk = stream.read(READ_CHUNK_SIZE)
+        eof = not chunk
+        buffer = buffer[pos:] + text_decoder.decode(chunk, final=eof)
+        pos = 0
+
+    def next_char() -> str:
+        """
+        Skips whitespace and returns the next character, or an empty string at end of stream.
+        """
+        nonlocal pos
+        while True:
+            while pos < len(buffer) and buffer[pos].isspace():
+                pos += 1
+            if pos < len(buffer):
+                return buffer[pos]
+            if eof:
+                return ""
+            read_more()
+
+    if next_char() != "[":
+        raise ValueError("Data file does not contain a JSON array")
+    pos += 1
+    if next_char() == "]":
+        return
+
+    while True:
+        char = next_char()
+        if char == "":
+            raise ValueError("Unterminated JSON array in data file")
+        if char in ",]":
+            raise ValueError(f"Unexpected {char!r} in JSON array in data file")
+
+        while True:
+            try:
+                item, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                read_more()
+                continue
+            # A value ending exactly at the buffer end may continue in the next chunk (e.g. a number).
+            if end < len(buffer) or eof:
+                break
+            read_more()
+        pos = end
+        yield item
+
+        char = next_char()
+        if char == "]":
+            return
+        if char != ",":
+            if char == "":
+                raise ValueError("Unterminated JSON array in data file")
+            raise ValueError(f"Expected ',' or ']' in JSON array in data file, found {char!r}")
+        pos += 1
+
+
+def iter_pages(path: PathLike) -> Iterator[Dict[str, Any]]:
+    """
+    Iterates page records from a JSON or JSON Lines data file, optionally gzip compressed.
+    Uncompressed files are memory-mapped; records are yielded one at a time.
+    """
+    path = Path(path)
+    if os.path.getsize(path) == 0:
+        return
+
+    if is_gzip_file(path):
+        with gzip.open(path, "rb") as f:
+            if is_jsonl_file(path):
+                for line in f:
+                    if line.strip():
+                        yield json.loads(line)
+            else:
+                yield from _iter_json_array(f)
+        return
+
+    with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        if is_jsonl_file(path):
+            for line in iter(mapped.readline, b""):
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            yield from _iter_json_array(mapped)
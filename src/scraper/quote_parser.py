@@ -4,6 +4,7 @@ from urllib.parse import urljoin
 from src.scraper.utils.auth import QuoteScraperAuth
 from src.scraper.utils.constants import SESSION_GET_TIMEOUT
 from src.data.models import Quote, Tag
+from src.scraper.utils.profiling import profile_stage
 from src.scraper.utils.scraper_utils import safe_select
 from src.scraper.utils.setup_utils import get_logger
 
@@ -49,10 +50,11 @@ class QuotePageParser:
 
         goodreads_url = ""
         try:
-            resp = self.session.get(author_url, timeout=SESSION_GET_TIMEOUT)
-            resp.raise_for_status()
-            author_soup = BeautifulSoup(resp.content, 'html.parser')
-            link = author_soup.select_one('a[href*="goodreads.com"]')
+            with profile_stage("author_page"):
+                resp = self.session.get(author_url, timeout=SESSION_GET_TIMEOUT)
+                resp.raise_for_status()
+                author_soup = BeautifulSoup(resp.content, 'html.parser')
+                link = author_soup.select_one('a[href*="goodreads.com"]')
             if link and link.has_attr('href'):
                 goodreads_url = link['href']
             else:
@@ -2,18 +2,29 @@ import requests
 import time
 import sys
 import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
 from requests.exceptions import RequestException, ConnectTimeout, HTTPError
+from src.data.models import Quote
+from src.scraper.utils.archive import HtmlArchiveWriter, HtmlArchiveReader, ArchiveSession
 from src.scraper.utils.auth import QuoteScraperAuth
+from src.scraper.utils.constants import ARCHIVE_INDEX_FILE
 from src.scraper.quote_parser import QuotePageParser
+from src.scraper.utils.profiling import profile_stage, disable_inherited_profiling
 from src.scraper.utils.scraper_utils import handle_request_exception, append_page_data
 from src.scraper.utils.setup_utils import get_logger
 
 logger = get_logger(__name__)
 
 
-def login_and_get_parser(site_url: str, username: str, password: str) -> QuotePageParser:
+def login_and_get_parser(
+        site_url: str,
+        username: str,
+        password: str,
+        archive: Optional[HtmlArchiveWriter] = None) -> QuotePageParser:
     """
     Handles authentication and returns an authenticated QuoteParser instance.
+    If an archive is given, every response fetched through the parser's session is saved to it.
 
     Raises:
         SystemExit: If authentication or initial request fails.
@@ -30,7 +41,7 @@ def login_and_get_parser(site_url: str, username: str, password: str) -> QuotePa
         logger.error("Initial request failed: %s", e)
         sys.exit("Exiting due to failure in initial request.")
 
-    auth = QuoteScraperAuth()
+    auth = QuoteScraperAuth(archive=archive)
     try:
         if not auth.login(username, password):
             logger.error("Login failed for user '%s'.", username)
@@ -57,8 +68,10 @@ def process_single_page(parser: QuotePageParser, current_url: str, output_file:
     while True:
         try:
             start_time = time.time()
-            quotes = parser.parse_quotes_from_page(current_url)
-            append_page_data(current_url, quotes, output_file)
+            with profile_stage("parse"):
+                quotes = parser.parse_quotes_from_page(current_url)
+            with profile_stage("write"):
+                append_page_data(current_url, quotes, output_file)
             elapsed = time.time() - start_time
             logger.info("Processed %s: %d quotes in %.2f seconds", current_url, len(quotes), elapsed)
             return True
@@ -110,7 +123,8 @@ def scrape_all_quote_pages(parser: QuotePageParser, base_url: str, output_file:
         else:
             delay_between_pages = min(delay_between_pages * 2, max_delay)
 
-        next_page_url = parser.get_next_page_url(current_url, seen_urls)
+        with profile_stage("pagination"):
+            next_page_url = parser.get_next_page_url(current_url, seen_urls)
         if next_page_url:
             logger.info("Delaying %.2f seconds before next page", delay_between_pages)
             time.sleep(delay_between_pages)
@@ -121,17 +135,83 @@ def scrape_all_quote_pages(parser: QuotePageParser, base_url: str, output_file:
             break
 
 
-def run_scraper(base_url: str, username: str, password: str, output_file: str) -> None:
+def run_scraper(
+        base_url: str,
+        username: str,
+        password: str,
+        output_file: str,
+        archive_responses: bool = True) -> None:
     """
     Entry point to run the full scraper process: login_and_get_parser and crawl.
+    Raw responses are archived for later offline re-parsing unless archive_responses is False.
     """
     logger.info("Running scraper for site: %s", base_url)
 
-    quote_parser = login_and_get_parser(base_url, username, password)
-    scrape_all_quote_pages(quote_parser, base_url, output_file)
+    archive = HtmlArchiveWriter() if archive_responses else None
+    with profile_stage("login"):
+        quote_parser = login_and_get_parser(base_url, username, password, archive)
+    with profile_stage("crawl"):
+        scrape_all_quote_pages(quote_parser, base_url, output_file)
 
     if os.path.exists(output_file):
         size_kb = os.path.getsize(output_file) / 1024
         logger.info("Scraper finished. Output saved to '%s' (%.2f KB)", output_file, size_kb)
     else:
         logger.warning("Scraper finished, but output file not found: %s", output_file)
+
+
+_offline_parser: Optional[QuotePageParser] = None
+
+
+def _init_offline_worker(base_url: str) -> None:
+    """
+    Process pool initializer: builds a parser whose session reads from the archive.
+    Profiling inherited from a --profile parent is switched off, as worker data is not collected.
+    """
+    global _offline_parser
+    disable_inherited_profiling()
+    auth = QuoteScraperAuth(base_url)
+    auth.session = ArchiveSession(HtmlArchiveReader())
+    _offline_parser = QuotePageParser(auth)
+
+
+def _reparse_archived_page(page_url: str) -> Tuple[str, Optional[List[Quote]]]:
+    """
+    Re-parses a single archived listing page inside a worker process.
+    Returns None instead of the quotes if parsing fails, so the page is skipped as in a live run.
+    """
+    try:
+        return page_url, _offline_parser.parse_quotes_from_page(page_url)
+    except Exception:
+        logger.exception("Failed re-parsing archived page %s", page_url)
+        return page_url, None
+
+
+def run_offline_reparse(base_url: str, output_file: str, workers: Optional[int] = None) -> None:
+    """
+    Re-runs quote parsing over the raw HTML archive of the last crawl, without network access.
+    Listing pages are parsed in parallel across a process pool and written in crawl order.
+    """
+    if not ARCHIVE_INDEX_FILE.exists():
+        logger.error("No raw HTML archive found at '%s'. Run a live scrape first.", ARCHIVE_INDEX_FILE)
+        sys.exit("Exiting because there is no archive to re-parse.")
+
+    page_urls = HtmlArchiveReader().listing_urls()
+    logger.info("Re-parsing %d archived pages with %s workers", len(page_urls), workers or os.cpu_count())
+
+    if os.path.exists(output_file):
+        os.remove(output_file)
+
+    start_time = time.time()
+    with profile_stage("reparse"), ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_offline_worker,
+            initargs=(base_url,)) as executor:
+        for page_url, quotes in executor.map(_reparse_archived_page, page_urls):
+            if quotes is None:
+                logger.error("Skipping page due to re-parse failure: %s", page_url)
+                continue
+            with profile_stage("write"):
+                append_page_data(page_url, quotes, output_file)
+
+    logger.info("Offline re-parse of %d pages finished in %.2f seconds", len(page_urls), time.time() - start_time)
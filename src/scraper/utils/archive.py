@@ -0,0 +1,179 @@
+import gzip
+import json
+import os
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urljoin
+
+from requests import Response
+from requests.exceptions import ConnectionError
+
+from src.scraper.utils.constants import ARCHIVE_DATA_FILE, ARCHIVE_INDEX_FILE
+from src.scraper.utils.setup_utils import get_logger
+
+logger = get_logger(__name__)
+
+
+def classify_url(url: str) -> str:
+    """
+    Returns the kind of page a URL points to: 'author', 'login' or 'listing'.
+    """
+    if "/author/" in url:
+        return "author"
+    if "/login" in url:
+        return "login"
+    return "listing"
+
+
+class HtmlArchiveWriter:
+    """
+    Appends every fetched response body to a compressed, append-only archive.
+
+    Each body is stored as an independent gzip member, so any record can be
+    decompressed on its own from its offset. A JSON Lines index maps each
+    (method, URL) pair to the offset and length of its member.
+    """
+
+    def __init__(self, data_file: Path = ARCHIVE_DATA_FILE, index_file: Path = ARCHIVE_INDEX_FILE):
+        self.data_file = Path(data_file)
+        self.index_file = Path(index_file)
+        self.data_file.parent.mkdir(parents=True, exist_ok=True)
+        self._archived: set = set()
+
+    def record_response(self, response: Response, *args, **kwargs) -> Response:
+        """
+        Response hook for a requests Session. Archives the response body once per (method, URL).
+        Error responses are archived too but do not count, so a later successful retry is still
+        written and, being the last entry for its URL, is the one the reader serves.
+        """
+        method = response.request.method if response.request is not None else "GET"
+        key = (method, response.url)
+        if key in self._archived:
+            return response
+
+        try:
+            self.write_record(
+                url=response.url,
+                method=method,
+                status=response.status_code,
+                encoding=response.encoding,
+                content=response.content,
+                location=response.headers.get("Location")
+            )
+            if response.status_code < 400:
+                self._archived.add(key)
+        except Exception as e:
+            logger.warning("Failed to archive response for %s: %s", response.url, e)
+        return response
+
+    def write_record(
+            self,
+            url: str,
+            method: str,
+            status: int,
+            encoding: Optional[str],
+            content: bytes,
+            location: Optional[str] = None) -> None:
+        """
+        Compresses a single response body and appends it, with its index entry, to the archive.
+        """
+        member = gzip.compress(content)
+        offset = os.path.getsize(self.data_file) if self.data_file.exists() else 0
+
+        with self.data_file.open("ab") as f:
+            f.write(member)
+
+        entry = {
+            "url": url,
+            "method": method,
+            "status": status,
+            "kind": classify_url(url),
+            "encoding": encoding,
+            "location": location,
+            "offset": offset,
+            "length": len(member),
+            "fetched_at": time.time()
+        }
+        with self.index_file.open("a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        logger.debug("Archived %s %s (%d compressed bytes)", method, url, len(member))
+
+
+class HtmlArchiveReader:
+    """
+    Random-access reader over an archive produced by HtmlArchiveWriter.
+    """
+
+    def __init__(self, data_file: Path = ARCHIVE_DATA_FILE, index_file: Path = ARCHIVE_INDEX_FILE):
+        self.data_file = Path(data_file)
+        self.index_file = Path(index_file)
+        self.entries: List[Dict] = []
+        self._by_key: Dict[Tuple[str, str], Dict] = {}
+
+        with self.index_file.open("r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                self.entries.append(entry)
+                self._by_key[(entry["method"], entry["url"])] = entry
+
+    def listing_urls(self) -> List[str]:
+        """
+        Returns the URLs of archived listing pages, in the order they were first fetched.
+        Pages whose last archived response is an error are left out, as a live run skips them.
+        """
+        urls: List[str] = []
+        for entry in self.entries:
+            if entry["kind"] != "listing" or entry["method"] != "GET" or entry.get("location"):
+                continue
+            if self._by_key[("GET", entry["url"])]["status"] >= 400:
+                continue
+            if entry["url"] not in urls:
+                urls.append(entry["url"])
+        return urls
+
+    def get_entry(self, url: str, method: str = "GET") -> Optional[Dict]:
+        return self._by_key.get((method, url))
+
+    def read_content(self, entry: Dict) -> bytes:
+        """
+        Reads and decompresses the body of a single archived record.
+        """
+        with self.data_file.open("rb") as f:
+            f.seek(entry["offset"])
+            return gzip.decompress(f.read(entry["length"]))
+
+
+class ArchiveSession:
+    """
+    Drop-in replacement for the parser's requests Session that serves GETs from the archive.
+    """
+
+    max_redirects = 5
+
+    def __init__(self, reader: HtmlArchiveReader):
+        self.reader = reader
+
+    def get(self, url: str, **kwargs) -> Response:
+        """
+        Builds a Response from the archived record for the URL, following archived redirects.
+
+        Raises:
+            ConnectionError: If the URL (or a redirect target) was never archived.
+        """
+        for _ in range(self.max_redirects + 1):
+            entry = self.reader.get_entry(url)
+            if entry is None:
+                raise ConnectionError(f"URL not found in archive: {url}")
+            if not entry.get("location"):
+                break
+            url = urljoin(url, entry["location"])
+
+        response = Response()
+        response.url = url
+        response.status_code = entry["status"]
+        response.encoding = entry["encoding"]
+        response._content = self.reader.read_content(entry)
+        return response
@@ -1,6 +1,9 @@
+from typing import Optional
+
 from requests import Session
 from bs4 import BeautifulSoup
 
+from src.scraper.utils.archive import HtmlArchiveWriter
 from src.scraper.utils.constants import SESSION_GET_TIMEOUT, BASE_SITE_URL
 from src.scraper.utils.scraper_utils import safe_select
 from src.scraper.utils.setup_utils import get_logger
@@ -11,9 +14,11 @@ logger = get_logger(__name__)
 class QuoteScraperAuth:
     """Handles authentication for the quotes.toscrape.com website."""
 
-    def __init__(self, base_url: str = BASE_SITE_URL):
+    def __init__(self, base_url: str = BASE_SITE_URL, archive: Optional[HtmlArchiveWriter] = None):
         self.base_url = base_url
         self.session = Session()
+        if archive is not None:
+            self.session.hooks["response"].append(archive.record_response)
 
     def login(self, username: str, password: str) -> bool:
         """
@@ -13,3 +13,7 @@ LOG_FILE = OUTPUT_FOLDER / "client.log"
 QA_REPORT_FILE = OUTPUT_FOLDER / "qa_report.txt"
 
 LOG_FORMAT = "%(asctime)s - %(levelname)s - %(filename)s - %(message)s"
+
+ARCHIVE_FOLDER = OUTPUT_FOLDER / "archive"
+ARCHIVE_DATA_FILE = ARCHIVE_FOLDER / "raw_pages.gz"
+ARCHIVE_INDEX_FILE = ARCHIVE_FOLDER / "raw_pages.idx.jsonl"
@@ -0,0 +1,206 @@
+import cProfile
+import os
+import sys
+import threading
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from src.scraper.utils.constants import OUTPUT_FOLDER
+from src.scraper.utils.setup_utils import get_logger
+
+logger = get_logger(__name__)
+
+PSTATS_FILE_NAME = "profile.pstats"
+FLAMEGRAPH_FILE_NAME = "profile_flamegraph.txt"
+ALLOCATIONS_FILE_NAME = "profile_allocations.txt"
+
+_stage_stack: List[str] = []
+
+# While RunProfiler is active: one [traced memory at start, highest peak seen] pair per open stage,
+# below them a root pair for the whole run, and per-stage peak statistics keyed by stage path.
+_memory_frames: List[List[int]] = []
+_stage_memory: Dict[str, Dict[str, int]] = {}
+
+
+def _start_stage_memory() -> None:
+    current, peak = tracemalloc.get_traced_memory()
+    _memory_frames[-1][1] = max(_memory_frames[-1][1], peak)
+    tracemalloc.reset_peak()
+    _memory_frames.append([current, current])
+
+
+def _end_stage_memory(stage_path: str) -> None:
+    current, peak = tracemalloc.get_traced_memory()
+    start, stage_peak = _memory_frames.pop()
+    stage_peak = max(stage_peak, peak)
+    _memory_frames[-1][1] = max(_memory_frames[-1][1], stage_peak)
+    tracemalloc.reset_peak()
+
+    stats = _stage_memory.setdefault(stage_path, {"calls": 0, "max_peak": 0, "retained": 0})
+    stats["calls"] += 1
+    stats["max_peak"] = max(stats["max_peak"], stage_peak - start)
+    stats["retained"] += current - start
+
+
+@contextmanager
+def profile_stage(name: str) -> Iterator[None]:
+    """
+    Tags everything executed inside the block with a crawl stage name.
+    Stages nest, and are recorded in the collapsed stacks written by RunProfiler.
+    During a profiled run the peak traced memory of each stage is recorded as well;
+    outside one this only pushes and pops a list entry.
+    """
+    tracking = bool(_memory_frames) and tracemalloc.is_tracing()
+    if tracking:
+        _start_stage_memory()
+    _stage_stack.append(name)
+    stage_path = ";".join(_stage_stack)
+    try:
+        yield
+    finally:
+        _stage_stack.pop()
+        if tracking:
+            _end_stage_memory(stage_path)
+
+
+def disable_inherited_profiling() -> None:
+    """
+    Turns off cProfile and tracemalloc inherited by a forked worker process.
+    Profiled runs only report on the parent process, so workers should not pay the overhead.
+    """
+    sys.setprofile(None)
+    monitoring = getattr(sys, "monitoring", None)
+    if monitoring is not None and monitoring.get_tool(monitoring.PROFILER_ID) is not None:
+        monitoring.set_events(monitoring.PROFILER_ID, 0)
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
+    _stage_stack.clear()
+    _memory_frames.clear()
+    _stage_memory.clear()
+
+
+class StackSampler:
+    """
+    Samples the call stack of a thread at a fixed interval and counts collapsed stacks,
+    each prefixed with the crawl stages active at sampling time.
+    """
+
+    def __init__(self, thread_id: int, interval: float = 0.005):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            frames = []
+            while frame is not None:
+                code = frame.f_code
+                frames.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            stages = [f"stage:{stage}" for stage in list(_stage_stack)] or ["stage:main"]
+            self.stacks[";".join(stages + frames[::-1])] += 1
+
+    def write_collapsed(self, path: Path) -> None:
+        """
+        Writes samples in collapsed-stack format, readable by flamegraph.pl and speedscope.
+        """
+        with path.open("w", encoding="utf-8") as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+
+class RunProfiler:
+    """
+    Context manager profiling a scraper run with cProfile, tracemalloc and a stack sampler.
+
+    On exit it writes into the output folder:
+        - profile.pstats: cProfile statistics, loadable with pstats or snakeviz
+        - profile_flamegraph.txt: stage-tagged collapsed stacks for flamegraph tools
+        - profile_allocations.txt: peak traced memory per stage and top-N allocation sites retained at exit
+    """
+
+    def __init__(self, output_folder: Path = OUTPUT_FOLDER, top_n: int = 25, sample_interval: float = 0.005):
+        self.output_folder = Path(output_folder)
+        self.top_n = top_n
+        self.sample_interval = sample_interval
+        self._profiler: Optional[cProfile.Profile] = None
+        self._sampler: Optional[StackSampler] = None
+
+    def __enter__(self) -> "RunProfiler":
+        self.output_folder.mkdir(parents=True, exist_ok=True)
+        tracemalloc.start()
+        _stage_memory.clear()
+        _memory_frames.append([0, 0])
+        self._sampler = StackSampler(threading.get_ident(), self.sample_interval)
+        self._sampler.start()
+        self._profiler = cProfile.Profile()
+        self._profiler.enable()
+        logger.info("Profiling enabled. Reports will be written to '%s'", self.output_folder)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self._profiler.disable()
+        self._sampler.stop()
+        snapshot = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+        peak = max(peak, _memory_frames.pop()[1])
+        _memory_frames.clear()
+        tracemalloc.stop()
+
+        try:
+            self._profiler.dump_stats(str(self.output_folder / PSTATS_FILE_NAME))
+            self._sampler.write_collapsed(self.output_folder / FLAMEGRAPH_FILE_NAME)
+            self._write_allocations(snapshot, peak)
+            self._log_stage_summary()
+        except Exception as e:
+            logger.exception("Failed to write profiling reports: %s", e)
+
+    def _write_allocations(self, snapshot: tracemalloc.Snapshot, peak: int) -> None:
+        snapshot = snapshot.filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        ])
+        top_stats = snapshot.statistics("lineno")
+        with (self.output_folder / ALLOCATIONS_FILE_NAME).open("w", encoding="utf-8") as f:
+            f.write("ALLOCATION REPORT\n")
+            f.write("=" * 40 + "\n\n")
+            f.write(f"Peak traced memory: {peak / 1024:.2f} KB\n\n")
+
+            f.write("Peak memory by stage (above the memory in use when the stage started):\n")
+            by_peak = sorted(_stage_memory.items(), key=lambda item: item[1]["max_peak"], reverse=True)
+            for stage_path, stats in by_peak:
+                f.write(
+                    f"- {stage_path}: max peak {stats['max_peak'] / 1024:.2f} KB over {stats['calls']} calls, "
+                    f"net retained {stats['retained'] / 1024:.2f} KB\n"
+                )
+
+            f.write(f"\nMemory retained at exit: {sum(s.size for s in top_stats) / 1024:.2f} KB\n")
+            f.write(f"Top {self.top_n} allocation sites retained at exit (transient allocations are not listed):\n")
+            for index, stat in enumerate(top_stats[:self.top_n], 1):
+                frame = stat.traceback[0]
+                f.write(f"{index}. {frame.filename}:{frame.lineno} - {stat.size / 1024:.2f} KB in {stat.count} blocks\n")
+
+    def _log_stage_summary(self) -> None:
+        stage_samples: Counter = Counter()
+        for stack, count in self._sampler.stacks.items():
+            stages = [part for part in stack.split(";") if part.startswith("stage:")]
+            stage_samples[stages[-1][len("stage:"):]] += count
+
+        total = sum(stage_samples.values())
+        for stage, count in stage_samples.most_common():
+            logger.info("Profile stage '%s': %d samples (%.1f%%)", stage, count, count / total * 100)
@@ -3,9 +3,8 @@ from typing import Optional
 
 from bs4 import BeautifulSoup
 from requests.exceptions import RequestException
-import json
-import os
 
+from src.data.storage import append_record
 from src.scraper.utils.setup_utils import get_logger
 
 logger = get_logger(__name__)
@@ -93,30 +92,20 @@ def append_page_data(
         page_quotes: list,
         output_file: str):
     """
-    Appends quotes from a page to a JSON file in a structured format.
+    Appends quotes from a page to the output data file in a structured format.
 
     Each entry includes the page number, URL, and a list of quotes.
-    If the file exists, existing data is loaded and updated; otherwise, a new list is created.
+    The entry is streamed to the end of the file, so previously written pages are never re-read.
+    The file may be JSON or JSON Lines, optionally gzip compressed (see src.data.storage).
     If the page number is not found in the URL, it defaults to 1.
 
     Args:
         page_url (str): URL of the scraped page.
         page_quotes (list): List of quote dictionaries from the page.
-        output_file (str): Path to the output JSON file.
+        output_file (str): Path to the output data file.
     """
     logger.debug("Appending data for page URL: %s", page_url)
 
-    data = []
-    if os.path.exists(output_file):
-        logger.debug("Output file exists. Attempting to load existing data from: %s", output_file)
-        with open(output_file, "r", encoding="utf-8") as f:
-            try:
-                data = json.load(f)
-                logger.debug("Loaded existing data with %d entries.", len(data))
-            except json.JSONDecodeError as e:
-                logger.warning("Failed to decode existing JSON file. Starting with empty data. Error: %s", e)
-                data = []
-
     last_part = page_url.rstrip("/").split("/")[-1]
     try:
         page_number = int(last_part)
@@ -130,12 +119,10 @@ def append_page_data(
         "quotes": [quote.model_dump(mode="json") for quote in page_quotes]
     }
 
-    data.append(page_data)
     logger.info("Appending data for page %d with %d quotes.", page_number, len(page_quotes))
 
     try:
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=4)
-            logger.debug("Successfully wrote updated data to file: %s", output_file)
+        append_record(output_file, page_data)
+        logger.debug("Successfully wrote page data to file: %s", output_file)
     except Exception as e:
         logger.exception("Failed to write data to file: %s", e)
@@ -1,6 +1,7 @@
 import logging
 import os
 import shutil
+from typing import Iterable
 
 from src.scraper.utils.constants import LOG_FORMAT, OUTPUT_FOLDER
 
@@ -36,9 +37,9 @@ def get_logger(name: str = __name__) -> logging.Logger:
 logger = get_logger(__name__)
 
 
-def clear_last_execution_data() -> None:
+def clear_last_execution_data(exclude: Iterable[str] = ()) -> None:
     """
-    Deletes all files and subdirectories inside the 'outputs' folder.
+    Deletes all files and subdirectories inside the 'outputs' folder, except those named in exclude.
     """
     outputs_dir = os.path.join(os.getcwd(), OUTPUT_FOLDER)
 
@@ -46,6 +47,8 @@ def clear_last_execution_data() -> None:
         return
 
     for filename in os.listdir(outputs_dir):
+        if filename in exclude:
+            continue
         file_path = os.path.join(outputs_dir, filename)
         try:
             if os.path.isfile(file_path) or os.path.islink(file_path):
@@ -1,29 +1,26 @@
 import json
-import pandas as pd
+from collections import Counter
 from jsonschema import validate, ValidationError
 from pathlib import Path
 
+from src.data.storage import iter_pages
 from src.scraper.utils.constants import DATA_FILE, QA_REPORT_FILE
 
+QUOTE_FIELDS = ["page", "page_url", "text", "author", "author_url", "tags", "goodreads_url"]
+URL_FIELDS = ["page_url", "author_url", "goodreads_url"]
 
-def run_qa():
-    data_path = Path(DATA_FILE)
-    qa_report_path = Path(QA_REPORT_FILE)
-
-    with data_path.open() as f:
-        pages = json.load(f)
-
-    page_numbers = [page.get("page") for page in pages]
-    duplicate_pages = [
-        page for page in set(page_numbers) if page_numbers.count(page) > 1
-    ]
 
-    all_quotes = []
-    for page in pages:
+def iter_quote_records(data_path: Path, page_counts: Counter):
+    """
+    Yields one flat record per quote, streaming pages from the data file.
+    Page numbers are counted into page_counts in the same pass.
+    """
+    for page in iter_pages(data_path):
         page_number = page.get("page")
+        page_counts[page_number] += 1
         page_url = page.get("url")
         for quote in page.get("quotes", []):
-            all_quotes.append({
+            yield {
                 "page": page_number,
                 "page_url": page_url,
                 "text": quote.get("text"),
@@ -31,9 +28,12 @@ def run_qa():
                 "author_url": quote.get("author_url"),
                 "tags": quote.get("tags"),
                 "goodreads_url": quote.get("goodreads_url")
-            })
+            }
 
-    df = pd.DataFrame(all_quotes)
+
+def run_qa(data_file=DATA_FILE):
+    data_path = Path(data_file)
+    qa_report_path = Path(QA_REPORT_FILE)
 
     schema_path = Path(__file__).parent / "schema.json"
     with schema_path.open() as schema_file:
@@ -46,24 +46,30 @@ def run_qa():
             return False
         return True
 
-    field_coverage = (df.map(is_present).mean() * 100).round(2).to_dict()
+    def is_valid_url(url):
+        return isinstance(url, str) and url.startswith("http")
 
+    page_counts = Counter()
+    total_count = 0
+    present_counts = Counter()
+    invalid_url_counts = Counter()
     valid_count = 0
     invalid_count = 0
-    for i, row in df.iterrows():
+    for record in iter_quote_records(data_path, page_counts):
+        total_count += 1
+        present_counts.update(field for field in QUOTE_FIELDS if is_present(record[field]))
+        invalid_url_counts.update(field for field in URL_FIELDS if not is_valid_url(record[field]))
         try:
-            validate(instance=row.to_dict(), schema=schema)
+            validate(instance=record, schema=schema)
             valid_count += 1
         except ValidationError:
             invalid_count += 1
 
-    def is_valid_url(url):
-        return isinstance(url, str) and url.startswith("http")
+    duplicate_pages = [page for page, count in page_counts.items() if count > 1]
 
-    invalid_urls = {
-        "page_url": df[~df["page_url"].apply(is_valid_url)]["page_url"].tolist(),
-        "author_url": df[~df["author_url"].apply(is_valid_url)]["author_url"].tolist(),
-        "goodreads_url": df[~df["goodreads_url"].apply(is_valid_url)]["goodreads_url"].tolist()
+    field_coverage = {
+        field: round(present_counts[field] / total_count * 100, 2) if total_count else 0.0
+        for field in QUOTE_FIELDS
     }
 
     with qa_report_path.open("w") as f:
@@ -91,9 +97,9 @@ def run_qa():
             f.write("- All pages are unique.\n")
 
         f.write("\nURL Validation:\n")
-        for field, urls in invalid_urls.items():
-            if urls:
-                f.write(f"- Invalid {field}: {len(urls)} occurrences\n")
+        for field in URL_FIELDS:
+            if invalid_url_counts[field]:
+                f.write(f"- Invalid {field}: {invalid_url_counts[field]} occurrences\n")
             else:
                 f.write(f"- All {field} values are valid URLs\n")
 
@@ -0,0 +1,98 @@
+import gzip
+import io
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from src.data import storage
+from src.data.storage import COMPRESSIONS, OUTPUT_FORMATS, append_record, iter_pages, resolve_data_file
+
+
+def make_pages():
+    return [
+        {"page": 1, "url": "https://quotes.toscrape.com/", "quotes": []},
+        {
+            "page": 2,
+            "url": "https://quotes.toscrape.com/page/2/",
+            "quotes": [{"text": "“Ünïcödé — 引用”", "author": "Zoë", "tags": [{"name": "ñ", "url": "https://x/ñ"}]}]
+        },
+        {
+            "page": 3,
+            "url": "https://quotes.toscrape.com/page/3/",
+            "quotes": [{"text": "é" * 1000, "author": "Long", "tags": []}]
+        },
+        {"page": 12345678, "url": "https://quotes.toscrape.com/page/12345678/", "quotes": []},
+    ]
+
+
+class StorageRoundTripTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.base_file = Path(self.tmp_dir.name) / "data.json"
+
+    def test_round_trip_all_formats(self):
+        pages = make_pages()
+        for output_format in OUTPUT_FORMATS:
+            for compression in COMPRESSIONS:
+                for chunk_size in (storage.READ_CHUNK_SIZE, 7):
+                    with self.subTest(format=output_format, compression=compression, chunk_size=chunk_size):
+                        path = resolve_data_file(self.base_file, output_format, compression)
+                        path.unlink(missing_ok=True)
+                        for page in pages:
+                            append_record(path, page)
+
+                        with mock.patch.object(storage, "READ_CHUNK_SIZE", chunk_size):
+                            self.assertEqual(list(iter_pages(path)), pages)
+
+    def test_json_output_is_standard_json(self):
+        pages = make_pages()
+        for compression in COMPRESSIONS:
+            with self.subTest(compression=compression):
+                path = resolve_data_file(self.base_file, "json", compression)
+                for page in pages:
+                    append_record(path, page)
+
+                raw = path.read_bytes()
+                if compression == "gzip":
+                    raw = gzip.decompress(raw)
+                self.assertEqual(json.loads(raw), pages)
+
+    def test_append_rejects_unexpected_closing_block(self):
+        plain_path = resolve_data_file(self.base_file, "json", "none")
+        with plain_path.open("w", encoding="utf-8") as f:
+            json.dump([{"page": 1}], f, indent=4)
+        gzip_path = resolve_data_file(self.base_file, "json", "gzip")
+        gzip_path.write_bytes(gzip.compress(b'[{"page": 1}]'))
+
+        for path in (plain_path, gzip_path):
+            with self.subTest(path=path.name):
+                original = path.read_bytes()
+                with self.assertRaises(ValueError):
+                    append_record(path, {"page": 2})
+                self.assertEqual(path.read_bytes(), original)
+
+
+class JsonArrayDecoderTest(unittest.TestCase):
+
+    def decode(self, raw: bytes, chunk_size: int = 3):
+        with mock.patch.object(storage, "READ_CHUNK_SIZE", chunk_size):
+            return list(storage._iter_json_array(io.BytesIO(raw)))
+
+    def test_values_split_across_chunks(self):
+        self.assertEqual(self.decode(b"[12345678, 9]"), [12345678, 9])
+        self.assertEqual(self.decode(" [ {\"a\": \"éé\"} ,\n{} ] ".encode("utf-8")), [{"a": "éé"}, {}])
+        self.assertEqual(self.decode(b"[]"), [])
+
+    def test_malformed_arrays(self):
+        for raw in (b"[,,1]", b"[1,,2]", b"[1,]", b"[1 2]", b"[1", b"{}"):
+            with self.subTest(raw=raw):
+                with self.assertRaises(ValueError):
+                    self.decode(raw)
+
+
+if __name__ == "__main__":
+    unittest.main()